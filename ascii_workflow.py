@@ -6,47 +6,75 @@ A tool for generating ASCII art visualizations of workflows and pipelines from Y
 """
 
 import argparse
+import io
 import json
 import sys
-import yaml
+import textwrap
+from functools import lru_cache
+from array import array
+from collections import deque, namedtuple
 from typing import Dict, List, Optional, Any, Tuple
 
+import yaml
+
+try:
+    # libyaml-backed loader, ~5-10x faster than the pure-Python one
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Style glyphs are packed into namedtuples at import so the draw loops can
+# unpack them into locals instead of hashing dict keys per access
+BoxStyle = namedtuple("BoxStyle", [
+    "top_left", "top_right", "bottom_left", "bottom_right",
+    "horizontal", "vertical", "padding"
+])
+
+ConnectionStyle = namedtuple("ConnectionStyle", [
+    "vertical", "horizontal", "down_right", "down_left",
+    "up_right", "up_left", "cross"
+])
+
 # Default box styles
 BOX_STYLES = {
-    "start": {
-        "top_left": "┌", "top_right": "┐", "bottom_left": "└", "bottom_right": "┘",
-        "horizontal": "─", "vertical": "│", "padding": 1
-    },
-    "process": {
-        "top_left": "┌", "top_right": "┐", "bottom_left": "└", "bottom_right": "┘", 
-        "horizontal": "─", "vertical": "│", "padding": 1
-    },
-    "tool": {
-        "top_left": "╔", "top_right": "╗", "bottom_left": "╚", "bottom_right": "╝",
-        "horizontal": "═", "vertical": "║", "padding": 1
-    },
-    "decision": {
-        "top_left": "╭", "top_right": "╮", "bottom_left": "╰", "bottom_right": "╯",
-        "horizontal": "─", "vertical": "│", "padding": 1
-    },
-    "result": {
-        "top_left": "┏", "top_right": "┓", "bottom_left": "┗", "bottom_right": "┛",
-        "horizontal": "━", "vertical": "┃", "padding": 1
-    },
-    "special": {
-        "top_left": "╒", "top_right": "╕", "bottom_left": "╘", "bottom_right": "╛",
-        "horizontal": "═", "vertical": "│", "padding": 1
-    }
+    "start": BoxStyle("┌", "┐", "└", "┘", "─", "│", 1),
+    "process": BoxStyle("┌", "┐", "└", "┘", "─", "│", 1),
+    "tool": BoxStyle("╔", "╗", "╚", "╝", "═", "║", 1),
+    "decision": BoxStyle("╭", "╮", "╰", "╯", "─", "│", 1),
+    "result": BoxStyle("┏", "┓", "┗", "┛", "━", "┃", 1),
+    "special": BoxStyle("╒", "╕", "╘", "╛", "═", "│", 1),
 }
 
 # Connection characters
 CONNECTIONS = {
-    "normal": {"vertical": "│", "horizontal": "─", "down_right": "┌", "down_left": "┐", "up_right": "└", "up_left": "┘", "cross": "┼"},
-    "thick": {"vertical": "┃", "horizontal": "━", "down_right": "┏", "down_left": "┓", "up_right": "┗", "up_left": "┛", "cross": "╋"},
-    "double": {"vertical": "║", "horizontal": "═", "down_right": "╔", "down_left": "╗", "up_right": "╚", "up_left": "╝", "cross": "╬"},
-    "dashed": {"vertical": "┊", "horizontal": "┄", "down_right": "┌", "down_left": "┐", "up_right": "└", "up_left": "┘", "cross": "┼"},
+    "normal": ConnectionStyle("│", "─", "┌", "┐", "└", "┘", "┼"),
+    "thick": ConnectionStyle("┃", "━", "┏", "┓", "┗", "┛", "╋"),
+    "double": ConnectionStyle("║", "═", "╔", "╗", "╚", "╝", "╬"),
+    "dashed": ConnectionStyle("┊", "┄", "┌", "┐", "└", "┘", "┼"),
 }
 
+@lru_cache(maxsize=256)
+def _border_rows(style: BoxStyle, width: int) -> Tuple[str, str]:
+    """Pre-render the top and bottom border rows for a (style, width) pair.
+
+    Nodes sharing a style and width reuse the same strings, so drawing a
+    border edge is one cached lookup plus one slice write.
+    """
+    horizontal = style.horizontal * (width - 2)
+    return (style.top_left + horizontal + style.top_right,
+            style.bottom_left + horizontal + style.bottom_right)
+
+
 # Arrow styles
 ARROWS = {
     "normal": "→",
@@ -69,16 +97,31 @@ class Node:
         self.type = node_type
         self.icon = icon
         self.description = description
-        # Use default style for the node type or custom style if provided
-        self.style = style or BOX_STYLES.get(node_type, BOX_STYLES["process"])
+        # Use default style for the node type, with any custom overrides
+        # merged on top
+        default_style = BOX_STYLES.get(node_type, BOX_STYLES["process"])
+        if isinstance(style, dict):
+            # Ignore unknown keys so definitions with extra entries keep
+            # loading
+            overrides = {key: value for key, value in style.items()
+                         if key in BoxStyle._fields}
+            self.style = default_style._replace(**overrides)
+        else:
+            self.style = style or default_style
         # Calculated during layout phase
         self.x = 0
         self.y = 0
         self.width = 0
         self.height = 0
-        
+        # Memoized results (label/description/style never change after construction)
+        self._display_text: Optional[List[str]] = None
+        self._dims: Optional[Tuple[int, int]] = None
+
     def get_display_text(self) -> List[str]:
         """Generate the text to display inside the node box."""
+        if self._display_text is not None:
+            return self._display_text
+
         lines = []
         
         # Add icon if available
@@ -93,45 +136,71 @@ class Node:
         if self.description:
             # Wrap description text to a reasonable length
             max_line_length = max(len(display_text), 30)
-            wrapped_desc = []
-            
-            words = self.description.split()
-            current_line = []
-            current_length = 0
-            
-            for word in words:
-                if current_length + len(word) + (1 if current_length > 0 else 0) <= max_line_length:
-                    if current_length > 0:
-                        current_line.append(word)
-                        current_length += len(word) + 1  # +1 for the space
-                    else:
-                        current_line.append(word)
-                        current_length += len(word)
-                else:
-                    wrapped_desc.append(" ".join(current_line))
-                    current_line = [word]
-                    current_length = len(word)
-            
-            if current_line:
-                wrapped_desc.append(" ".join(current_line))
-            
-            for line in wrapped_desc:
-                lines.append(line)
-        
+            lines.extend(textwrap.wrap(self.description, width=max_line_length,
+                                       break_long_words=False,
+                                       break_on_hyphens=False))
+
+        self._display_text = lines
         return lines
-    
+
     def calculate_dimensions(self) -> Tuple[int, int]:
         """Calculate the width and height of the node box."""
+        if self._dims is not None:
+            self.width, self.height = self._dims
+            return self._dims
+
         text_lines = self.get_display_text()
-        padding = self.style["padding"]
-        
+        padding = self.style.padding
+
         # Width is the length of the longest line plus padding on both sides
         self.width = max(len(line) for line in text_lines) + (padding * 2)
-        
+
         # Height is the number of lines plus padding on top and bottom plus borders
         self.height = len(text_lines) + (padding * 2)
-        
-        return self.width, self.height
+
+        self._dims = (self.width, self.height)
+        return self._dims
+
+
+class _CharCanvas:
+    """Contiguous array('u') canvas used when NumPy is unavailable.
+
+    Backed by a single flat buffer indexed as y * width + x, and supports
+    the small subset of 2D indexing the draw code uses: scalar [y, x]
+    writes, row slices [y, x0:x1], and column slices [y0:y1, x].
+    """
+
+    def __init__(self, height: int, width: int):
+        self.height = height
+        self.width = width
+        self.buffer = array('u', ' ' * (height * width))
+
+    def __setitem__(self, index: Tuple, value) -> None:
+        y, x = index
+        if isinstance(y, slice):
+            # Column slice: one write per row
+            start, stop, _ = y.indices(self.height)
+            for row in range(start, stop):
+                self.buffer[row * self.width + x] = value
+        elif isinstance(x, slice):
+            # Row slice: a single char is repeated; a sequence fills as-is
+            start, stop, _ = x.indices(self.width)
+            if stop <= start:
+                return
+            if isinstance(value, str) and len(value) == 1:
+                value = value * (stop - start)
+            self.buffer[y * self.width + start:y * self.width + stop] = \
+                array('u', ''.join(value))
+        else:
+            # Match NumPy '<U1' semantics: a multi-char string keeps only
+            # its first character
+            self.buffer[y * self.width + x] = value[0]
+
+    def rows(self):
+        """Iterate over the canvas rows as strings."""
+        width = self.width
+        for i in range(self.height):
+            yield self.buffer[i * width:(i + 1) * width].tounicode()
 
 
 class Connection:
@@ -156,17 +225,46 @@ class Workflow:
         self.title = title
         self.nodes: Dict[str, Node] = {}
         self.connections: List[Connection] = []
-        self.canvas: List[List[str]] = []
+        self.canvas: Optional[Any] = None  # np.ndarray or _CharCanvas
         self.canvas_width = 0
         self.canvas_height = 0
-        
+        # Cached graph structures, rebuilt lazily after the graph changes
+        self._adj: Optional[Dict[str, List[str]]] = None
+        self._indegree: Optional[Dict[str, int]] = None
+        # Parallel layout arrays (structure-of-arrays), filled during layout
+        self._idx: Dict[str, int] = {}
+        self._x = self._y = self._w = self._h = None
+        self._max_node_width = 0
+        # Last rendered output, keyed on a hash of the workflow content
+        self._render_cache: Tuple[Optional[int], Optional[str]] = (None, None)
+
     def add_node(self, node: Node) -> None:
         """Add a node to the workflow."""
         self.nodes[node.id] = node
-        
+        self._adj = self._indegree = None
+        self._render_cache = (None, None)
+
     def add_connection(self, connection: Connection) -> None:
         """Add a connection to the workflow."""
         self.connections.append(connection)
+        self._adj = self._indegree = None
+        self._render_cache = (None, None)
+
+    def _build_adjacency(self) -> None:
+        """Build the adjacency lists and indegree counts in one pass, if stale."""
+        if self._adj is not None:
+            return
+
+        adj = {node_id: [] for node_id in self.nodes}
+        indegree = {node_id: 0 for node_id in self.nodes}
+
+        for conn in self.connections:
+            if conn.source in adj and conn.target in adj:
+                adj[conn.source].append(conn.target)
+                indegree[conn.target] += 1
+
+        self._adj = adj
+        self._indegree = indegree
         
     def calculate_layout(self) -> None:
         """Calculate the positions of all nodes and connections."""
@@ -180,131 +278,187 @@ class Workflow:
         # First pass: determine node dimensions
         for node_id, node in self.nodes.items():
             node.calculate_dimensions()
-            
-        # Find topological ordering
-        ordered_nodes = self._topological_sort()
-        
+
+        # Repack the per-node layout fields into parallel arrays; positions
+        # are filled in below as nodes are placed
+        self._pack_layout_arrays()
+
         # Second pass: assign positions
-        max_width = max(node.width for node in self.nodes.values()) + 10  # Add some spacing
-        
+        max_width = self._max_node_width + 10  # Add some spacing
+
         # Group nodes by "level" based on connections
-        node_levels = self._assign_levels(ordered_nodes)
+        node_levels = self._assign_levels()
         
-        # Assign vertical positions by level
+        # Assign vertical positions by level, tracking the rightmost extent
+        # as nodes are placed instead of rescanning them afterwards
         level_heights = {}
         current_y = 2
-        
+        max_extent = 0
+
         for level, level_nodes in sorted(node_levels.items()):
-            max_height = max(self.nodes[node_id].height for node_id in level_nodes)
+            max_height = max(self._h[self._idx[node_id]] for node_id in level_nodes)
             level_heights[level] = max_height + 2  # Add spacing
-            
+
             # Place nodes within this level
             available_width = max(80, max_width * len(level_nodes))
             spacing = available_width // (len(level_nodes) + 1)
-            
+
             for i, node_id in enumerate(level_nodes):
                 node = self.nodes[node_id]
                 node.x = (i + 1) * spacing - (node.width // 2)
                 node.y = current_y
-                
+                idx = self._idx[node_id]
+                self._x[idx] = node.x
+                self._y[idx] = node.y
+                if node.x + node.width > max_extent:
+                    max_extent = node.x + node.width
+
             current_y += level_heights[level]
-        
+
         # Calculate canvas dimensions
-        self.canvas_width = max(
-            max(node.x + node.width for node in self.nodes.values()) + 5,
-            len(self.title) + 4
-        )
+        self.canvas_width = max(max_extent + 5, len(self.title) + 4)
         self.canvas_height = current_y + 2
         
         # Route connections
         self._route_connections()
         
-    def _topological_sort(self) -> List[str]:
-        """Sort nodes in topological order."""
-        # Build adjacency list
-        adjacency = {node_id: [] for node_id in self.nodes}
-        
-        for conn in self.connections:
-            if conn.source in adjacency and conn.target in adjacency:
-                adjacency[conn.source].append(conn.target)
-        
-        # DFS-based topological sort
-        visited = set()
-        temp_visited = set()
-        result = []
-        
-        def visit(node_id):
-            if node_id in temp_visited:
-                # Cycle detected, skip
-                return
-            if node_id in visited:
-                return
-                
-            temp_visited.add(node_id)
-            
-            for neighbor in adjacency[node_id]:
-                visit(neighbor)
-                
-            temp_visited.remove(node_id)
-            visited.add(node_id)
-            result.append(node_id)
-        
-        # Visit all nodes
+    def _assign_levels(self) -> Dict[int, List[str]]:
+        """Assign nodes to levels based on dependencies.
+
+        A single Kahn-style BFS both orders the nodes topologically and
+        assigns each one the level after its deepest dependency, touching
+        every edge exactly once.
+        """
+        self._build_adjacency()
+        adjacency = self._adj
+        indegree = self._indegree.copy()  # working copy, decremented in place
+
+        queue = deque(node_id for node_id in self.nodes if indegree[node_id] == 0)
+        levels = {node_id: 0 for node_id in self.nodes}
+
+        # Keep the O(V+E) loop lean: every node already has a level entry
+        # (no .get per edge) and the deque methods are bound once
+        pop = queue.popleft
+        push = queue.append
+        while queue:
+            node_id = pop()
+            next_level = levels[node_id] + 1
+            for succ in adjacency[node_id]:
+                if levels[succ] < next_level:
+                    levels[succ] = next_level
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    push(succ)
+
+        # Nodes never dequeued sit on a cycle or downstream of one; Kahn
+        # alone would leave the whole lot at level 0
+        leftover = [node_id for node_id in self.nodes if indegree[node_id] > 0]
+        if leftover:
+            self._assign_residual_levels(leftover, levels)
+
+        # Group by level, in node insertion order
+        node_levels: Dict[int, List[str]] = {}
         for node_id in self.nodes:
-            if node_id not in visited:
-                visit(node_id)
-                
-        # Reverse for correct order
-        return list(reversed(result))
-    
-    def _assign_levels(self, ordered_nodes: List[str]) -> Dict[int, List[str]]:
-        """Assign nodes to levels based on dependencies."""
-        node_levels = {}
-        node_to_level = {}
-        
-        # Build reversed adjacency for checking dependencies
-        rev_adjacency = {node_id: [] for node_id in self.nodes}
-        
-        for conn in self.connections:
-            if conn.source in rev_adjacency and conn.target in rev_adjacency:
-                rev_adjacency[conn.target].append(conn.source)
-        
-        # Assign levels
-        for node_id in ordered_nodes:
-            if not rev_adjacency[node_id]:
-                # No dependencies, assign to level 0
-                node_to_level[node_id] = 0
-            else:
-                # Assign to level after all dependencies
-                max_dep_level = max(
-                    (node_to_level.get(dep, 0) for dep in rev_adjacency[node_id]),
-                    default=0
-                )
-                node_to_level[node_id] = max_dep_level + 1
-        
-        # Group by level
-        for node_id, level in node_to_level.items():
-            if level not in node_levels:
-                node_levels[level] = []
-            node_levels[level].append(node_id)
-            
+            node_levels.setdefault(levels[node_id], []).append(node_id)
+
         return node_levels
+
+    def _assign_residual_levels(self, leftover: List[str],
+                                levels: Dict[str, int]) -> None:
+        """Assign levels to the nodes Kahn's algorithm could not dequeue.
+
+        These nodes sit on a cycle or downstream of one. Order them with an
+        iterative DFS that skips back edges, then give each node the level
+        after its deepest already-levelled dependency - the same
+        skip-cycles behaviour the pre-Kahn implementation had.
+        """
+        adjacency = self._adj
+        pending = set(leftover)
+
+        # Dependencies of each leftover node, in one sweep over the graph
+        preds = {node_id: [] for node_id in leftover}
+        for node_id in self.nodes:
+            for succ in adjacency[node_id]:
+                if succ in pending:
+                    preds[succ].append(node_id)
+
+        # Reversed DFS postorder over the leftover subgraph is a
+        # topological order once back edges are skipped
+        state = {}
+        order = []
+        for root in leftover:
+            if state.get(root, 0):
+                continue
+            state[root] = 1
+            stack = [(root, iter(adjacency[root]))]
+            while stack:
+                node_id, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if neighbor in pending and not state.get(neighbor, 0):
+                        state[neighbor] = 1
+                        stack.append((neighbor, iter(adjacency[neighbor])))
+                        break
+                else:
+                    stack.pop()
+                    state[node_id] = 2
+                    order.append(node_id)
+        order.reverse()
+
+        # Dependencies still pending are the skipped back edges and count
+        # as level 0, as in the old node_to_level.get(dep, 0)
+        for node_id in order:
+            deepest = 0
+            for dep in preds[node_id]:
+                if dep not in pending and levels[dep] > deepest:
+                    deepest = levels[dep]
+            levels[node_id] = deepest + 1
+            pending.discard(node_id)
     
+    def _pack_layout_arrays(self) -> None:
+        """Repack per-node layout fields into parallel int arrays.
+
+        Keeping x/y/width/height contiguous (structure-of-arrays) lets the
+        layout maxima and connection routing read plain integers instead of
+        chasing attribute lookups through every Node object.
+        """
+        self._idx = {node_id: i for i, node_id in enumerate(self.nodes)}
+        count = len(self.nodes)
+        if np is not None:
+            self._x = np.zeros(count, dtype=np.int32)
+            self._y = np.zeros(count, dtype=np.int32)
+            self._w = np.zeros(count, dtype=np.int32)
+            self._h = np.zeros(count, dtype=np.int32)
+        else:
+            self._x = [0] * count
+            self._y = [0] * count
+            self._w = [0] * count
+            self._h = [0] * count
+
+        max_node_width = 0
+        for i, node in enumerate(self.nodes.values()):
+            self._w[i] = node.width
+            self._h[i] = node.height
+            if node.width > max_node_width:
+                max_node_width = node.width
+        self._max_node_width = max_node_width
+
     def _route_connections(self) -> None:
         """Calculate paths for all connections."""
+        idx = self._idx
+        xs, ys, ws, hs = self._x, self._y, self._w, self._h
+
         for conn in self.connections:
-            if conn.source not in self.nodes or conn.target not in self.nodes:
+            source = idx.get(conn.source)
+            target = idx.get(conn.target)
+            if source is None or target is None:
                 continue
-                
-            source = self.nodes[conn.source]
-            target = self.nodes[conn.target]
-            
+
             # Simple routing: straight line if possible, otherwise L-shaped
-            source_x = source.x + source.width // 2
-            source_y = source.y + source.height
-            target_x = target.x + target.width // 2
-            target_y = target.y
-            
+            source_x = int(xs[source] + ws[source] // 2)
+            source_y = int(ys[source] + hs[source])
+            target_x = int(xs[target] + ws[target] // 2)
+            target_y = int(ys[target])
+
             # Path consists of points to draw lines between
             conn.path = [(source_x, source_y), (target_x, target_y)]
     
@@ -312,19 +466,43 @@ class Workflow:
         """Render the workflow to ASCII art."""
         if not self.nodes:
             return "Empty workflow"
-            
+
+        # Reuse the previous output if the workflow content is unchanged
+        key = hash((
+            self.title,
+            tuple((node.id, node.label, node.type, node.icon, node.description)
+                  for node in self.nodes.values()),
+            tuple((conn.source, conn.target, conn.type, conn.label)
+                  for conn in self.connections),
+        ))
+        if key == self._render_cache[0]:
+            return self._render_cache[1]
+
+        # Content changed since the last render (including in-place field
+        # mutation): drop the per-node memos and the old layout so the new
+        # text is actually re-measured and re-placed
+        if self._render_cache[0] is not None:
+            for node in self.nodes.values():
+                node._display_text = None
+                node._dims = None
+            self.canvas = None
+
         # Calculate layout if not done already
-        if not self.canvas:
+        if self.canvas is None:
             self.calculate_layout()
-            
-        # Initialize canvas with spaces
-        self.canvas = [[' ' for _ in range(self.canvas_width)] for _ in range(self.canvas_height)]
-        
-        # Draw title
+
+        # Initialize canvas with spaces (one contiguous buffer, one cell per character)
+        if np is not None:
+            self.canvas = np.full((self.canvas_height, self.canvas_width), ' ', dtype='<U1')
+        else:
+            self.canvas = _CharCanvas(self.canvas_height, self.canvas_width)
+
+        # Draw title, clipped to the canvas once
         title_pos = (self.canvas_width - len(self.title)) // 2
-        for i, char in enumerate(self.title):
-            if 0 <= title_pos + i < self.canvas_width:
-                self.canvas[0][title_pos + i] = char
+        lo = max(0, title_pos)
+        hi = min(self.canvas_width, title_pos + len(self.title))
+        if lo < hi:
+            self.canvas[0, lo:hi] = list(self.title[lo - title_pos:hi - title_pos])
         
         # Draw connections first so nodes can overwrite them
         self._draw_connections()
@@ -333,88 +511,119 @@ class Workflow:
         for node_id, node in self.nodes.items():
             self._draw_node(node)
         
-        # Convert canvas to string
-        return '\n'.join(''.join(row) for row in self.canvas)
+        # Stream the rows into one output buffer; each row is viewed as a
+        # single fixed-width string, so no intermediate row list is built
+        if np is not None:
+            rows = self.canvas.view(f'<U{self.canvas_width}').ravel()
+        else:
+            rows = self.canvas.rows()
+
+        out = io.StringIO()
+        write = out.write
+        for row in rows:
+            write(row)
+            write('\n')
+
+        output = out.getvalue().rstrip('\n')
+        self._render_cache = (key, output)
+        return output
     
     def _draw_node(self, node: Node) -> None:
         """Draw a node on the canvas."""
         style = node.style
-        padding = style["padding"]
-        
-        # Draw the box boundaries
-        # Top horizontal line
-        for x in range(node.x, node.x + node.width):
-            if 0 <= x < self.canvas_width and 0 <= node.y < self.canvas_height:
-                if x == node.x:
-                    self.canvas[node.y][x] = style["top_left"]
-                elif x == node.x + node.width - 1:
-                    self.canvas[node.y][x] = style["top_right"]
-                else:
-                    self.canvas[node.y][x] = style["horizontal"]
-        
-        # Bottom horizontal line
-        for x in range(node.x, node.x + node.width):
-            if 0 <= x < self.canvas_width and 0 <= node.y + node.height - 1 < self.canvas_height:
-                if x == node.x:
-                    self.canvas[node.y + node.height - 1][x] = style["bottom_left"]
-                elif x == node.x + node.width - 1:
-                    self.canvas[node.y + node.height - 1][x] = style["bottom_right"]
-                else:
-                    self.canvas[node.y + node.height - 1][x] = style["horizontal"]
-        
-        # Vertical lines
-        for y in range(node.y + 1, node.y + node.height - 1):
-            if 0 <= y < self.canvas_height:
-                if 0 <= node.x < self.canvas_width:
-                    self.canvas[y][node.x] = style["vertical"]
-                if 0 <= node.x + node.width - 1 < self.canvas_width:
-                    self.canvas[y][node.x + node.width - 1] = style["vertical"]
-        
+        padding = style.padding
+        canvas = self.canvas
+        canvas_width = self.canvas_width
+        canvas_height = self.canvas_height
+
+        # Clip the box to the canvas once, then fill each edge with a slice assignment
+        top = node.y
+        bottom = node.y + node.height - 1
+        left = node.x
+        right = node.x + node.width - 1
+
+        x0 = max(0, left)
+        x1 = min(canvas_width, right + 1)
+        if x0 >= x1:
+            return
+
+        # Horizontal edges come pre-rendered (corners included) per
+        # (style, width) pair, so each is one slice write
+        top_row, bottom_row = _border_rows(style, node.width)
+        if 0 <= top < canvas_height:
+            canvas[top, x0:x1] = list(top_row[x0 - left:x1 - left])
+        if 0 <= bottom < canvas_height:
+            canvas[bottom, x0:x1] = list(bottom_row[x0 - left:x1 - left])
+
+        # Vertical edges (between the corner rows)
+        y0 = max(0, top + 1)
+        y1 = min(canvas_height, bottom)
+        vertical = style.vertical
+        if 0 <= left < canvas_width:
+            canvas[y0:y1, left] = vertical
+        if 0 <= right < canvas_width:
+            canvas[y0:y1, right] = vertical
+
         # Draw node content
         lines = node.get_display_text()
-        
+
         for i, line in enumerate(lines):
             y = node.y + padding + i
-            if 0 <= y < self.canvas_height:
-                # Center text horizontally
+            if 0 <= y < canvas_height:
                 start_x = node.x + padding
-                end_x = min(node.x + node.width - padding, self.canvas_width)
-                
-                for j, char in enumerate(line):
-                    x = start_x + j
-                    if start_x <= x < end_x:
-                        self.canvas[y][x] = char
+                end_x = min(node.x + node.width - padding, canvas_width)
+
+                # Slice the visible portion of the line into the row in one write
+                lo = max(start_x, 0)
+                hi = min(start_x + len(line), end_x)
+                if lo < hi:
+                    canvas[y, lo:hi] = list(line[lo - start_x:hi - start_x])
     
     def _draw_connections(self) -> None:
         """Draw all connections on the canvas."""
+        canvas = self.canvas
+        canvas_width = self.canvas_width
+        canvas_height = self.canvas_height
+
         for conn in self.connections:
             if not conn.path or len(conn.path) < 2:
                 continue
-                
-            style = conn.style
-            
-            # Draw each segment of the path
+
+            vertical = conn.style.vertical
+            horizontal = conn.style.horizontal
+            last_segment = len(conn.path) - 2
+
+            # Draw each segment of the path; segments are always straight,
+            # so each one is a single clipped slice fill plus an optional
+            # arrow overwrite at the endpoint
             for i in range(len(conn.path) - 1):
                 start_x, start_y = conn.path[i]
                 end_x, end_y = conn.path[i + 1]
-                
-                # Draw a straight line
+
                 if start_x == end_x:  # Vertical line
-                    for y in range(min(start_y, end_y), max(start_y, end_y) + 1):
-                        if 0 <= start_x < self.canvas_width and 0 <= y < self.canvas_height:
-                            # Add arrow at the end
-                            if y == end_y - 1 and i == len(conn.path) - 2:
-                                self.canvas[y][start_x] = 'v'  # Down arrow
-                            else:
-                                self.canvas[y][start_x] = style["vertical"]
+                    if not 0 <= start_x < canvas_width:
+                        continue
+                    lo = min(start_y, end_y)
+                    hi = max(start_y, end_y) + 1
+                    y0, y1 = max(0, lo), min(canvas_height, hi)
+                    if y0 < y1:
+                        canvas[y0:y1, start_x] = vertical
+                    # Add arrow at the end
+                    if i == last_segment and lo <= end_y - 1 < hi \
+                            and 0 <= end_y - 1 < canvas_height:
+                        canvas[end_y - 1, start_x] = 'v'  # Down arrow
                 elif start_y == end_y:  # Horizontal line
-                    for x in range(min(start_x, end_x), max(start_x, end_x) + 1):
-                        if 0 <= x < self.canvas_width and 0 <= start_y < self.canvas_height:
-                            # Add arrow at the end
-                            if x == end_x - 1 and i == len(conn.path) - 2:
-                                self.canvas[start_y][x] = conn.arrow
-                            else:
-                                self.canvas[start_y][x] = style["horizontal"]
+                    if not 0 <= start_y < canvas_height:
+                        continue
+                    lo = min(start_x, end_x)
+                    hi = max(start_x, end_x) + 1
+                    x0, x1 = max(0, lo), min(canvas_width, hi)
+                    if x0 < x1:
+                        canvas[start_y, x0:x1] = horizontal
+                    # Add arrow at the end
+                    if i == last_segment and lo <= end_x - 1 < hi \
+                            and 0 <= end_x - 1 < canvas_width:
+                        canvas[start_y, end_x - 1] = conn.arrow
             
             # Add connection label if exists
             if conn.label:
@@ -427,25 +636,30 @@ class Workflow:
                     label_x = x + 1
                     label_y = y
                     
-                    if 0 <= label_y < self.canvas_height:
-                        for i, char in enumerate(conn.label):
-                            if 0 <= label_x + i < self.canvas_width:
-                                self.canvas[label_y][label_x + i] = char
+                    if 0 <= label_y < canvas_height:
+                        lo = max(0, label_x)
+                        hi = min(canvas_width, label_x + len(conn.label))
+                        if lo < hi:
+                            canvas[label_y, lo:hi] = \
+                                list(conn.label[lo - label_x:hi - label_x])
 
 
 def load_workflow_from_yaml(file_path: str) -> Workflow:
     """Load workflow definition from YAML file."""
     with open(file_path, 'r') as file:
-        data = yaml.safe_load(file)
-    
+        data = yaml.load(file, Loader=YamlSafeLoader)
+
     return create_workflow_from_dict(data)
 
 
 def load_workflow_from_json(file_path: str) -> Workflow:
     """Load workflow definition from JSON file."""
     with open(file_path, 'r') as file:
-        data = json.load(file)
-    
+        if orjson is not None:
+            data = orjson.loads(file.read())
+        else:
+            data = json.load(file)
+
     return create_workflow_from_dict(data)
 
 